@@ -0,0 +1,101 @@
+import importlib.util
+import json
+from pathlib import Path
+import pickle
+import tempfile
+from types import ModuleType
+from typing import Any, override
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+PACKAGE_DIR = Path(__file__).parent / "src" / "apple_docs"
+WWDC_DATA_DIR = PACKAGE_DIR / "data" / "wwdc"
+VIDEO_BUNDLE_PATH = "apple_docs/data/wwdc/bundle.bin"
+VIDEO_BUNDLE_INDEX_PATH = "apple_docs/data/wwdc/bundle.idx"
+VIDEOS_SNAPSHOT_PATH = "apple_docs/data/wwdc/videos.pkl"
+
+
+def write_video_bundle(data_dir: Path, output: Path, index_output: Path) -> int:
+    """
+    Consolidate the per-video JSON files into one blob file and an offset index.
+
+    The blob file is the concatenation of the pickled video dicts. The index maps
+    "{year}-{video_id}" to the (offset, length) of its pickle, so the runtime
+    memory-maps the blob file and only unpickles the videos it actually serves.
+
+    Args:
+        data_dir: The WWDC data directory containing videos/*.json.
+        output: Path of the blob file to write.
+        index_output: Path of the offset index to write.
+
+    Returns:
+        The number of bundled videos.
+    """
+    index: dict[str, tuple[int, int]] = {}
+    offset = 0
+    with output.open("wb") as f:
+        for path in sorted((data_dir / "videos").glob("*.json")):
+            blob = pickle.dumps(json.loads(path.read_bytes()), protocol=5)
+            f.write(blob)
+            index[path.stem] = (offset, len(blob))
+            offset += len(blob)
+
+    with index_output.open("wb") as f:
+        pickle.dump(index, f, protocol=5)
+    return len(index)
+
+
+def _load_wwdc_index() -> ModuleType:
+    """Load apple_docs.utils.wwdc_index by path, since importing the package pulls in the server dependencies."""
+    spec = importlib.util.spec_from_file_location("_wwdc_index", PACKAGE_DIR / "utils" / "wwdc_index.py")
+    if spec is None or spec.loader is None:
+        raise ImportError("Cannot load apple_docs/utils/wwdc_index.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_videos_snapshot(data_dir: Path, output: Path) -> int:
+    """
+    Pickle the sorted video list together with its by-year and by-topic indices.
+
+    The indices are built by the same index_videos helper that load_all_videos
+    uses, so the runtime can load this snapshot instead of parsing
+    all-videos.json and rebuilding them on every cold start.
+
+    Args:
+        data_dir: The WWDC data directory containing all-videos.json.
+        output: Path of the snapshot to write.
+
+    Returns:
+        The number of videos in the snapshot.
+    """
+    videos = json.loads((data_dir / "all-videos.json").read_bytes()).get("videos", [])
+    snapshot = _load_wwdc_index().index_videos(videos)
+
+    with output.open("wb") as f:
+        pickle.dump(snapshot, f, protocol=5)
+    return len(videos)
+
+
+class WWDCBundleBuildHook(BuildHookInterface):  # type: ignore[type-arg]
+    """Build hook that ships the consolidated WWDC video bundle and video index snapshot in wheels."""
+
+    PLUGIN_NAME = "custom"
+
+    @override
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        """Generate the bundle and snapshot and force-include them in the wheel."""
+        build_dir = Path(tempfile.mkdtemp())
+        bundle = build_dir / "bundle.bin"
+        bundle_index = build_dir / "bundle.idx"
+        count = write_video_bundle(WWDC_DATA_DIR, bundle, bundle_index)
+        self.app.display_info(f"Bundled {count} WWDC videos")
+        build_data["force_include"][str(bundle)] = VIDEO_BUNDLE_PATH
+        build_data["force_include"][str(bundle_index)] = VIDEO_BUNDLE_INDEX_PATH
+
+        snapshot = build_dir / "videos.pkl"
+        count = write_videos_snapshot(WWDC_DATA_DIR, snapshot)
+        self.app.display_info(f"Indexed {count} WWDC videos")
+        build_data["force_include"][str(snapshot)] = VIDEOS_SNAPSHOT_PATH
@@ -1,3 +1,7 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 
 from .tools.fetcher import fetch_apple_doc_json
@@ -6,7 +10,21 @@ from .tools.technologies import list_technologies
 from .utils.constants import ApiLimits
 
 
-mcp = FastMCP("apple-docs")
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    """
+    Warm up the WWDC caches in the background for the lifetime of the server.
+    """
+    from .utils.wwdc_data_source import warmup
+
+    task = asyncio.create_task(warmup())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+mcp = FastMCP("apple-docs", lifespan=_lifespan)
 
 
 @mcp.tool()
@@ -188,4 +206,7 @@ def main() -> None:
     """
     Main entry point for the Apple Developer Documentation MCP server.
     """
+    from .utils.wwdc_data_source import map_bundled_files
+
+    map_bundled_files()
     mcp.run()
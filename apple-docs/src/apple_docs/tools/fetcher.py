@@ -2,7 +2,7 @@ from typing import Any
 
 from apple_docs.utils import formatter
 from apple_docs.utils.constants import ProcessingLimits
-from apple_docs.utils.http_client import http_client
+from apple_docs.utils.http_client import get_http_client
 from apple_docs.utils.url_converter import convert_to_json_api_url
 
 
@@ -40,7 +40,7 @@ async def fetch_apple_doc_json(
 
     # TODO(zchee): Implement caching here if needed
 
-    json_data = await http_client.get_json(json_api_url)
+    json_data = await get_http_client().get_json(json_api_url)
 
     # Handle references if primary content is missing
     if not json_data.get("primaryContentSections") and json_data.get("references") and max_depth > 0:
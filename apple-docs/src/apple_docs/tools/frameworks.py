@@ -3,7 +3,7 @@ import re
 from typing import Any
 
 from apple_docs.utils.constants import ApiLimits, AppleUrls, ProcessingLimits
-from apple_docs.utils.http_client import http_client
+from apple_docs.utils.http_client import get_http_client
 
 
 # Cache for parsed framework symbols
@@ -50,11 +50,11 @@ async def _fetch_framework_data(framework: str) -> dict[str, Any]:
     """Fetch framework data, trying multiple URL patterns."""
     index_url = f"{AppleUrls.TUTORIALS_DATA}index/{framework.lower()}"
     try:
-        return await http_client.get_json(index_url)
+        return await get_http_client().get_json(index_url)
     except Exception:
         # Try with 'documentation' prefix if direct index fails
         index_url = f"{AppleUrls.TUTORIALS_DATA}documentation/{framework.lower()}"
-        return await http_client.get_json(index_url)
+        return await get_http_client().get_json(index_url)
 
 
 async def search_framework_symbols(
@@ -4,7 +4,7 @@ from urllib.parse import quote
 from bs4 import BeautifulSoup, Tag
 
 from apple_docs.utils.constants import ApiLimits, AppleUrls
-from apple_docs.utils.http_client import http_client
+from apple_docs.utils.http_client import get_http_client
 
 
 class SearchResult:
@@ -49,7 +49,7 @@ async def search_apple_docs(query: str, type: str = "all") -> str:
     search_url = f"{AppleUrls.SEARCH}?q={quote(query)}"
 
     try:
-        html = await http_client.get_text(search_url)
+        html = await get_http_client().get_text(search_url)
     except Exception as e:
         return f"Error: Failed to perform search: {str(e)}"
 
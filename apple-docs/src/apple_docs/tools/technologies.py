@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from apple_docs.utils.constants import ApiLimits, AppleUrls
-from apple_docs.utils.http_client import http_client
+from apple_docs.utils.http_client import get_http_client
 
 
 @dataclass
@@ -42,7 +42,7 @@ async def list_technologies(
         Formatted string containing technologies.
     """
     try:
-        data = await http_client.get_json(AppleUrls.TECHNOLOGIES_JSON)
+        data = await get_http_client().get_json(AppleUrls.TECHNOLOGIES_JSON)
         technologies = parse_technologies(data)
 
         filtered_technologies = apply_technology_filters(technologies, category, language, include_beta, limit)
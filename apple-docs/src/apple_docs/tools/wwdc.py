@@ -1,5 +1,4 @@
 import asyncio
-from collections.abc import Awaitable
 import re
 from typing import Any
 
@@ -11,6 +10,7 @@ from apple_docs.utils.wwdc_data_source import (
     load_all_videos,
     load_global_metadata,
     load_video_data,
+    load_videos_bulk,
 )
 
 
@@ -27,22 +27,7 @@ async def load_videos_details(videos: list[tuple[str, str]]) -> list[WWDCVideo]:
     Returns:
         List of WWDCVideo objects.
     """
-    sem = asyncio.Semaphore(20)
-
-    async def load_with_sem(year: str, video_id: str) -> WWDCVideo:
-        async with sem:
-            return await load_video_data(year, video_id)
-
-    tasks: list[Awaitable[WWDCVideo]] = []
-    for year, video_id in videos:
-        tasks.append(load_with_sem(year, video_id))
-
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    videos_list: list[WWDCVideo] = []
-    for res in results:
-        if isinstance(res, dict):
-            videos_list.append(res)
-    return videos_list
+    return await load_videos_bulk(videos)
 
 
 async def list_wwdc_videos(
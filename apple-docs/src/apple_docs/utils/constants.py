@@ -71,6 +71,20 @@ class RequestConfig:
     ]
 
 
+class CacheConfig:
+    """Configuration for response caching."""
+
+    DISK_CACHE_DIR_ENV = "APPLE_DOCS_CACHE_DIR"
+    DISK_CACHE_TTL = 3600.0
+    # Multi-megabyte feeds that only change on Apple's release cadence
+    DISK_CACHED_URLS = frozenset({
+        AppleUrls.TECHNOLOGIES_JSON,
+        AppleUrls.UPDATES_JSON,
+        AppleUrls.TECHNOLOGY_OVERVIEWS_JSON,
+        AppleUrls.SAMPLE_CODE_JSON,
+    })
+
+
 class ErrorMessages:
     """Standard error messages."""
 
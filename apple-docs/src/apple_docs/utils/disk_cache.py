@@ -0,0 +1,98 @@
+import contextlib
+from dataclasses import dataclass, replace
+import hashlib
+import logging
+import os
+from pathlib import Path
+import pickle
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A response body persisted on disk along with its validators."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Return True if the entry was fetched less than ttl seconds ago."""
+        return time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for revalidation."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def touch(self) -> CachedResponse:
+        """Return a copy of the entry marked as fetched now."""
+        return replace(self, fetched_at=time.time())
+
+
+class DiskCache:
+    """Persistent cache of raw response bodies keyed by URL."""
+
+    def __init__(self, directory: Path, ttl: float) -> None:
+        """
+        Initialize the disk cache.
+
+        Args:
+            directory: Directory where cache entries are stored.
+            ttl: Seconds an entry is served without revalidation.
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path_for(self, url: str) -> Path:
+        """Get the cache file path for a URL."""
+        return self.directory / f"{hashlib.sha1(url.encode()).hexdigest()}.pkl"
+
+    def get(self, url: str) -> CachedResponse | None:
+        """
+        Read a cached response.
+
+        Args:
+            url: The URL the response was fetched from.
+
+        Returns:
+            The cached response, or None if missing or unreadable.
+        """
+        try:
+            with self._path_for(url).open("rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Ignoring unreadable cache entry for {url}", exc_info=True)
+            return None
+
+        return entry if isinstance(entry, CachedResponse) else None
+
+    def set(self, url: str, entry: CachedResponse) -> None:
+        """
+        Write a cached response, ignoring filesystem errors.
+
+        Args:
+            url: The URL the response was fetched from.
+            entry: The response to persist.
+        """
+        path = self._path_for(url)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as f:
+                pickle.dump(entry, f, protocol=5)
+            tmp_path.replace(path)
+        except OSError:
+            logger.debug(f"Failed to write cache entry for {url}", exc_info=True)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
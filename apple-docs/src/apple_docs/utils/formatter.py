@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Any
 
 
@@ -59,81 +60,56 @@ def is_specific_api_document(json_data: dict[str, Any]) -> bool:
     return role in ["symbol", "collectionGroup"]
 
 
-def format_specific_api_content(json_data: dict[str, Any]) -> str:
-
-    """
-
-
-    Format content for a specific API document.
+type _PartsFormatter = Callable[[dict[str, Any], list[str]], None]
 
 
+def _format_declarations(section: dict[str, Any], parts: list[str]) -> None:
+    """Append a "declarations" primary content section."""
+    parts.append("## Declaration\n\n")
+    for decl in section.get("declarations", []):
+        code = "".join(token.get("text", "") for token in decl.get("tokens", []))
+        for lang in decl.get("languages", ["swift"]):
+            parts.append(f"```{lang}\n{code}\n```\n\n")
 
 
+def _format_parameters(section: dict[str, Any], parts: list[str]) -> None:
+    """Append a "parameters" primary content section."""
+    parts.append("## Parameters\n\n")
+    for param in section.get("parameters", []):
+        name = param.get("name", "")
+        parts.append(f"- `{name}`: ")
+        parts.append(" ".join(item.get("text", "") for item in param.get("content", [])))
+        parts.append("\n")
+    parts.append("\n")
 
-    Args:
 
+def _format_content(section: dict[str, Any], parts: list[str]) -> None:
+    """Append a "content" primary content section."""
+    parts.append(format_content_section(section))
 
-        json_data: The JSON data.
 
+_SECTION_FORMATTERS: dict[str, _PartsFormatter] = {
+    "declarations": _format_declarations,
+    "parameters": _format_parameters,
+    "content": _format_content,
+}
 
 
+def format_specific_api_content(json_data: dict[str, Any]) -> str:
+    """
+    Format content for a specific API document.
 
+    Args:
+        json_data: The JSON data.
 
     Returns:
-
-
         Formatted content string.
-
-
     """
-
     parts: list[str] = []
-
-    primary_content = json_data.get("primaryContentSections", [])
-
-    for section in primary_content:
-
-        kind = section.get("kind")
-
-        if kind == "declarations":
-
-            parts.append("## Declaration\n\n")
-
-            declarations = section.get("declarations", [])
-
-            for decl in declarations:
-
-                tokens = decl.get("tokens", [])
-
-                code = "".join(token.get("text", "") for token in tokens)
-
-                languages = decl.get("languages", ["swift"])
-
-                for lang in languages:
-
-                    parts.append(f"```{lang}\n{code}\n```\n\n")
-
-        elif kind == "parameters":
-
-            parts.append("## Parameters\n\n")
-
-            params = section.get("parameters", [])
-
-            for param in params:
-
-                name = param.get("name", "")
-
-                parts.append(f"- `{name}`: ")
-
-                parts.append(" ".join(item.get("text", "") for item in param.get("content", [])))
-
-                parts.append("\n")
-
-            parts.append("\n")
-
-        elif kind == "content":
-
-            parts.append(format_content_section(section))
+    for section in json_data.get("primaryContentSections", []):
+        formatter = _SECTION_FORMATTERS.get(section.get("kind"))
+        if formatter:
+            formatter(section, parts)
 
     return "".join(parts)
 
@@ -211,75 +187,51 @@ def format_api_collection_content(json_data: dict[str, Any]) -> str:
     return "".join(parts)
 
 
-def format_content_section(section: dict[str, Any]) -> str:
+def _format_paragraph(item: dict[str, Any], parts: list[str]) -> None:
+    """Append a "paragraph" content item."""
+    text = "".join(inline.get("text", "") for inline in item.get("inlineContent", []))
+    parts.append(f"{text}\n\n")
 
-    """
 
+def _format_heading(item: dict[str, Any], parts: list[str]) -> None:
+    """Append a "heading" content item."""
+    level = item.get("level", 2)
+    text = item.get("text", "")
+    parts.append(f"{'#' * level} {text}\n\n")
 
-    Format a generic content section.
 
+def _format_unordered_list(item: dict[str, Any], parts: list[str]) -> None:
+    """Append an "unorderedList" content item."""
+    for list_item in item.get("items", []):
+        text = "".join(
+            inline.get("text", "") for para in list_item.get("content", []) for inline in para.get("inlineContent", [])
+        )
+        parts.append(f"- {text}\n")
+    parts.append("\n")
 
 
+_CONTENT_ITEM_FORMATTERS: dict[str, _PartsFormatter] = {
+    "paragraph": _format_paragraph,
+    "heading": _format_heading,
+    "unorderedList": _format_unordered_list,
+}
 
 
-    Args:
-
+def format_content_section(section: dict[str, Any]) -> str:
+    """
+    Format a generic content section.
 
+    Args:
         section: The section data.
 
-
-
-
-
     Returns:
-
-
         Formatted section string.
-
-
     """
-
     parts: list[str] = []
-
-    text_content = section.get("content", [])
-
-    for item in text_content:
-
-        if item.get("type") == "paragraph":
-
-            text = "".join(inline.get("text", "") for inline in item.get("inlineContent", []))
-
-            parts.append(f"{text}\n\n")
-
-        elif item.get("type") == "heading":
-
-            level = item.get("level", 2)
-
-            text = item.get("text", "")
-
-            parts.append(f"{'#' * level} {text}\n\n")
-
-        elif item.get("type") == "unorderedList":
-
-            for list_item in item.get("items", []):
-
-                text = "".join(
-
-
-                    inline.get("text", "")
-
-
-                    for para in list_item.get("content", [])
-
-
-                    for inline in para.get("inlineContent", [])
-
-
-                )
-
-                parts.append(f"- {text}\n")
-
-            parts.append("\n")
+    for item in section.get("content", []):
+        formatter = _CONTENT_ITEM_FORMATTERS.get(item.get("type"))
+        if formatter:
+            formatter(item, parts)
 
     return "".join(parts)
 
@@ -1,11 +1,32 @@
 import asyncio
 import contextlib
-import random
-from typing import Any
+import itertools
+import logging
+import os
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
 
-import httpx
+from .constants import CacheConfig, ErrorMessages, RequestConfig
+from .disk_cache import CachedResponse, DiskCache
 
-from .constants import ErrorMessages, RequestConfig
+
+if TYPE_CHECKING:
+    import httpx
+
+
+logger = logging.getLogger(__name__)
+
+# Header dicts are built once and rotated per request; they must not be mutated
+_USER_AGENT_HEADERS = itertools.cycle(tuple({"User-Agent": ua} for ua in RequestConfig.USER_AGENTS))
+
+
+def _default_disk_cache_dir() -> Path:
+    """Resolve the directory used for persisted feed responses."""
+    if override := os.environ.get(CacheConfig.DISK_CACHE_DIR_ENV):
+        return Path(override)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "apple-docs"
 
 
 class HttpClient:
@@ -13,18 +34,24 @@ class HttpClient:
 
     _instance: HttpClient | None = None
     client: httpx.AsyncClient
-    _text_cache: dict[str, str] = {}
-    _json_cache: dict[str, Any] = {}
+    _disk_cache: DiskCache
+    _text_cache: dict[str, str]
+    _json_cache: dict[str, Any]
     MAX_CACHE_SIZE = 100
 
     def __new__(cls) -> HttpClient:
         """Create a new instance of HttpClient."""
         if cls._instance is None:
+            import httpx
+
             cls._instance = super().__new__(cls)
+            cls._instance._text_cache = {}
+            cls._instance._json_cache = {}
             cls._instance.client = httpx.AsyncClient(
                 timeout=RequestConfig.TIMEOUT,
                 follow_redirects=True,
             )
+            cls._instance._disk_cache = DiskCache(_default_disk_cache_dir(), CacheConfig.DISK_CACHE_TTL)
         return cls._instance
 
     def _prune_cache(self, cache: dict[str, Any]) -> None:
@@ -33,17 +60,29 @@ class HttpClient:
             with contextlib.suppress(StopIteration):
                 cache.pop(next(iter(cache)))
 
-    def _get_random_headers(self) -> dict[str, str]:
-        """Get headers with a random User-Agent."""
-        return {"User-Agent": random.choice(RequestConfig.USER_AGENTS)}
+    def _get_rotating_headers(self) -> dict[str, str]:
+        """Get shared, read-only headers with the next User-Agent in rotation."""
+        return next(_USER_AGENT_HEADERS)
+
+    async def _request_with_retry(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """
+        Make a GET request with retry logic and exponential backoff.
+
+        A 304 Not Modified response is returned as-is so callers sending
+        conditional headers can reuse their cached body.
+        """
+        import httpx
 
-    async def _request_with_retry(self, url: str) -> httpx.Response:
-        """Make a GET request with retry logic and exponential backoff."""
         last_exception = None
+        request_headers = self._get_rotating_headers()
+        if headers:
+            request_headers = {**request_headers, **headers}
 
         for attempt in range(RequestConfig.RETRIES + 1):
             try:
-                response = await self.client.get(url, headers=self._get_random_headers())
+                response = await self.client.get(url, headers=request_headers)
+                if response.status_code == 304:
+                    return response
                 response.raise_for_status()
                 return response
             except httpx.HTTPStatusError as e:
@@ -110,14 +149,61 @@ class HttpClient:
         if url in self._json_cache:
             return self._json_cache[url]
 
-        response = await self._request_with_retry(url)
+        if url in CacheConfig.DISK_CACHED_URLS:
+            body = await self._get_disk_cached_body(url)
+        else:
+            body = (await self._request_with_retry(url)).content
+
         try:
-            data = response.json()
-            self._prune_cache(self._json_cache)
-            self._json_cache[url] = data
-            return data
+            import orjson
+
+            data = orjson.loads(body)
         except Exception as e:
             raise Exception(f"{ErrorMessages.PARSE_FAILED}: {e}") from e
+        self._prune_cache(self._json_cache)
+        self._json_cache[url] = data
+        return data
+
+    async def _get_disk_cached_body(self, url: str) -> bytes:
+        """
+        Get a response body through the on-disk cache.
+
+        Fresh entries are served without touching the network. Stale entries are
+        revalidated with a conditional GET, and are served as a fallback if the
+        request fails.
+
+        Args:
+            url: The URL to fetch.
+
+        Returns:
+            The raw response body.
+
+        Raises:
+            Exception: If the request fails and nothing is cached.
+        """
+        cached = await asyncio.to_thread(self._disk_cache.get, url)
+        if cached is not None and cached.is_fresh(self._disk_cache.ttl):
+            return cached.body
+
+        try:
+            response = await self._request_with_retry(url, cached.conditional_headers() if cached else None)
+        except Exception:
+            if cached is None:
+                raise
+            logger.warning(f"Serving stale cached response for {url}", exc_info=True)
+            return cached.body
+
+        if response.status_code == 304 and cached is not None:
+            entry = cached.touch()
+        else:
+            entry = CachedResponse(
+                body=response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetched_at=time.time(),
+            )
+        await asyncio.to_thread(self._disk_cache.set, url, entry)
+        return entry.body
 
     def clear_cache(self) -> None:
         """Clear all internal caches."""
@@ -129,4 +215,14 @@ class HttpClient:
         await self.client.aclose()
 
 
-http_client = HttpClient()
+def get_http_client() -> HttpClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Deferring construction keeps httpx and its transport stack out of server startup
+    for sessions that never make a network request.
+
+    Returns:
+        The shared HttpClient instance.
+    """
+    return HttpClient()
@@ -1,6 +1,10 @@
 from urllib.parse import urlparse
 
 
+_APPLE_DEVELOPER_ORIGINS = ("https://developer.apple.com", "http://developer.apple.com")
+_APPLE_DEVELOPER_PREFIXES = tuple(f"{origin}/" for origin in _APPLE_DEVELOPER_ORIGINS)
+
+
 def convert_to_json_api_url(url: str) -> str | None:
     """
     Convert a standard Apple Developer URL to its JSON API equivalent.
@@ -18,14 +22,13 @@ def convert_to_json_api_url(url: str) -> str | None:
     if url.endswith(".json"):
         return url
 
-    parsed = urlparse(url)
-    path = parsed.path
+    # Chop the scheme and host, then any query string or fragment
+    parts = url.split("/", 3)
+    path = parts[3] if len(parts) == 4 else ""
+    path = path.partition("?")[0].partition("#")[0]
 
-    # Remove /documentation/ prefix if present
-    if path.startswith("/documentation/"):
-        path = path.replace("/documentation/", "", 1)
-    elif path.startswith("/"):
-        path = path[1:]
+    # Remove documentation/ prefix if present
+    path = path.removeprefix("documentation/")
 
     # Construct the JSON API URL
     # The pattern seems to be: https://developer.apple.com/tutorials/data/documentation/{path}.json
@@ -42,11 +45,9 @@ def is_valid_apple_developer_url(url: str) -> bool:
     Returns:
         True if valid, False otherwise.
     """
-    try:
-        parsed = urlparse(url)
-        return parsed.netloc == "developer.apple.com"
-    except Exception:
-        return False
+    # The trailing "/" in each prefix terminates the authority, so user-info tricks such as
+    # "https://developer.apple.com@example.com/" can never match.
+    return url.startswith(_APPLE_DEVELOPER_PREFIXES) or url in _APPLE_DEVELOPER_ORIGINS
 
 
 def extract_api_name_from_url(url: str) -> str | None:
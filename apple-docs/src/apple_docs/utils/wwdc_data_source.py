@@ -1,58 +1,182 @@
+import asyncio
+from collections import defaultdict
 import contextlib
+import functools
 import logging
+import mmap
+import os
 from pathlib import Path
-
-import aiofiles
-import orjson
+import pickle
+import sys
+from typing import Any
 
 from apple_docs.types.wwdc import GlobalMetadata, TopicIndex, TopicInfo, WWDCVideo, YearIndex
+from apple_docs.utils.wwdc_index import VideoIndices, index_videos
 
 
 logger = logging.getLogger(__name__)
 
 WWDC_DATA_DIR = Path(__file__).parent.parent / "data" / "wwdc"
+# Generated at wheel build time by hatch_build.py; absent in source checkouts
+VIDEO_BUNDLE_FILE = WWDC_DATA_DIR / "bundle.bin"
+VIDEO_BUNDLE_INDEX_FILE = WWDC_DATA_DIR / "bundle.idx"
+VIDEOS_SNAPSHOT_FILE = WWDC_DATA_DIR / "videos.pkl"
 
 # Caches
 _global_metadata_cache: GlobalMetadata | None = None
 _all_videos_cache: list[WWDCVideo] | None = None
-_video_data_cache: dict[str, WWDCVideo] = {}
+_global_metadata_lock = asyncio.Lock()
+_all_videos_lock = asyncio.Lock()
+_video_data_cache: dict[tuple[str, str], WWDCVideo] = {}
 VIDEO_CACHE_SIZE = 200
+MAX_CONCURRENT_DISK_READS = 16
+_disk_sem = asyncio.Semaphore(MAX_CONCURRENT_DISK_READS)
 
 # Indices
 _videos_by_year_cache: dict[str, list[WWDCVideo]] = {}
 _videos_by_topic_cache: dict[str, list[WWDCVideo]] = {}
 _topics_cache: dict[str, TopicInfo] = {}
+_topic_index_cache: dict[str, TopicIndex] = {}
+_year_index_cache: dict[str, YearIndex] = {}
+INDEX_CACHE_SIZE = 50
+# Index file paths for the known topic IDs and years, filled in from the global metadata
+_topic_index_paths: dict[str, str] = {}
+_year_index_paths: dict[str, str] = {}
+
+# Per-key locks so concurrent misses for the same file parse it only once. Locks
+# for keys that fail to load are dropped, so only files that exist keep one.
+_load_locks: defaultdict[tuple[str, Any], asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Read-only memory maps of the bundled JSON files, keyed by path relative to WWDC_DATA_DIR
+_mapped_files: dict[str, mmap.mmap] = {}
+# (offset, length) of each pickled video in VIDEO_BUNDLE_FILE keyed by "{year}-{video_id}",
+# and a read-only map of that file; pickles are sliced out of the map on demand
+_video_bundle: tuple[dict[str, tuple[int, int]], mmap.mmap | None] | None = None
+# Don't keep a duplicated descriptor per map; there are over a thousand bundled files
+_MMAP_OPTIONS: dict[str, Any] = {} if sys.platform == "win32" else {"trackfd": False}
+
+
+def map_bundled_files() -> int:
+    """
+    Memory-map every bundled WWDC JSON file so reads are served without I/O.
 
+    The data is read-only, so the maps stay valid for the process lifetime and
+    the page cache handles memory pressure. Calling this again is a no-op.
 
-async def read_bundled_file(file_path: str) -> str:
+    Returns:
+        The number of mapped files.
+    """
+    if _mapped_files or not is_data_available():
+        return len(_mapped_files)
+
+    # Per-video files are served from the bundle when one ships with the package
+    skip_videos = VIDEO_BUNDLE_FILE.exists()
+    for path in WWDC_DATA_DIR.rglob("*.json"):
+        if skip_videos and path.parent.name == "videos":
+            continue
+        try:
+            with path.open("rb") as f:
+                # Empty files cannot be mapped and fall back to a regular read
+                if os.fstat(f.fileno()).st_size > 0:
+                    _mapped_files[path.relative_to(WWDC_DATA_DIR).as_posix()] = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ, **_MMAP_OPTIONS
+                    )
+        except (OSError, ValueError):
+            logger.warning(f"Failed to map bundled data: {path}", exc_info=True)
+
+    return len(_mapped_files)
+
+
+def _read_video_bundle() -> tuple[dict[str, tuple[int, int]], mmap.mmap | None]:
+    """Load the build-time video offset index and map the blob file, or return an empty bundle if missing."""
+    try:
+        with VIDEO_BUNDLE_INDEX_FILE.open("rb") as f:
+            index: dict[str, tuple[int, int]] = pickle.load(f)
+        with VIDEO_BUNDLE_FILE.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ, **_MMAP_OPTIONS)
+        return index, mapped
+    except FileNotFoundError:
+        return {}, None
+    except Exception:
+        logger.warning("Ignoring unreadable WWDC video bundle", exc_info=True)
+        return {}, None
+
+
+async def _get_video_bundle() -> tuple[dict[str, tuple[int, int]], mmap.mmap | None]:
+    """Get the video bundle index and map, loading them once on first use."""
+    global _video_bundle
+    if _video_bundle is not None:
+        return _video_bundle
+
+    async with _load_locks[("bundle", None)]:
+        if _video_bundle is None:
+            _video_bundle = await asyncio.to_thread(_read_video_bundle)
+        return _video_bundle
+
+
+@functools.lru_cache(maxsize=2048)
+def _resolve(file_path: str) -> bytes:
+    """Join a relative path onto WWDC_DATA_DIR as an encoded filesystem path, reusing the result."""
+    return os.fsencode(WWDC_DATA_DIR / file_path)
+
+
+def _read_file(path: bytes) -> bytes:
+    """Read a whole file in one call."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+async def read_bundled_file(file_path: str) -> bytes | memoryview:
     """
     Read a file from the bundled WWDC data directory.
 
+    Files mapped by map_bundled_files are returned as a zero-copy view.
+
     Args:
         file_path: Relative path to the file within the data directory.
 
     Returns:
-        The content of the file as a string.
+        The raw content of the file, ready to be passed to orjson.
 
     Raises:
         Exception: If the file cannot be read.
     """
-    full_path = WWDC_DATA_DIR / file_path
+    if (mapped := _mapped_files.get(file_path)) is not None:
+        return memoryview(mapped)
+
     try:
-        async with aiofiles.open(full_path, encoding="utf-8") as f:
-            return await f.read()
+        return await asyncio.to_thread(_read_file, _resolve(file_path))
     except Exception as e:
         logger.error(f"Failed to read bundled data: {file_path}", exc_info=True)
         raise Exception(f"Failed to load WWDC data from {file_path}: {str(e)}") from e
 
 
-def _prune_cache(cache: dict[str, WWDCVideo]) -> None:
+def _json_loads(data: bytes | memoryview) -> Any:
+    """Parse JSON with orjson, deferring the import until data is first loaded."""
+    import orjson
+
+    return orjson.loads(data)
+
+
+def _prune_cache[K, V](cache: dict[K, V], max_size: int = VIDEO_CACHE_SIZE) -> None:
     """Ensure cache size stays within limits."""
-    if len(cache) >= VIDEO_CACHE_SIZE:
+    if len(cache) >= max_size:
         with contextlib.suppress(StopIteration):
             cache.pop(next(iter(cache)))
 
 
+def _read_videos_snapshot() -> VideoIndices | None:
+    """Load the build-time video list and indices, or None if the snapshot is missing."""
+    try:
+        with VIDEOS_SNAPSHOT_FILE.open("rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Ignoring unreadable WWDC video snapshot", exc_info=True)
+        return None
+
+
 async def load_global_metadata() -> GlobalMetadata:
     """
     Load the global index.json metadata.
@@ -63,22 +187,28 @@ async def load_global_metadata() -> GlobalMetadata:
     Raises:
         Exception: If the metadata cannot be loaded.
     """
-    global _global_metadata_cache, _topics_cache
+    global _global_metadata_cache, _topics_cache, _topic_index_paths, _year_index_paths
     if _global_metadata_cache:
         return _global_metadata_cache
 
-    try:
-        data = await read_bundled_file("index.json")
-        _global_metadata_cache = orjson.loads(data)
-
-        # Build topics cache
+    async with _global_metadata_lock:
         if _global_metadata_cache:
-             _topics_cache = {t["id"]: t for t in _global_metadata_cache["topics"]}
+            return _global_metadata_cache
 
-        return _global_metadata_cache  # type: ignore
-    except Exception as e:
-        logger.error("Failed to load global metadata", exc_info=True)
-        raise Exception("Failed to load WWDC metadata.") from e
+        try:
+            data = await read_bundled_file("index.json")
+            _global_metadata_cache = _json_loads(data)
+
+            # Build topics cache
+            if _global_metadata_cache:
+                _topics_cache = {t["id"]: t for t in _global_metadata_cache["topics"]}
+                _topic_index_paths = {topic_id: f"by-topic/{topic_id}/index.json" for topic_id in _topics_cache}
+                _year_index_paths = {year: f"by-year/{year}/index.json" for year in _global_metadata_cache["years"]}
+
+            return _global_metadata_cache  # type: ignore
+        except Exception as e:
+            logger.error("Failed to load global metadata", exc_info=True)
+            raise Exception("Failed to load WWDC metadata.") from e
 
 
 async def get_topic_by_id(topic_id: str) -> TopicInfo | None:
@@ -108,12 +238,23 @@ async def load_topic_index(topic_id: str) -> TopicIndex:
     Raises:
         Exception: If the topic index cannot be loaded.
     """
-    try:
-        data = await read_bundled_file(f"by-topic/{topic_id}/index.json")
-        return orjson.loads(data)
-    except Exception as e:
-        logger.error(f"Failed to load topic index: {topic_id}", exc_info=True)
-        raise Exception(f"Topic not found: {topic_id}") from e
+    if topic_id in _topic_index_cache:
+        return _topic_index_cache[topic_id]
+
+    async with _load_locks[("topic", topic_id)]:
+        if topic_id in _topic_index_cache:
+            return _topic_index_cache[topic_id]
+
+        try:
+            data = await read_bundled_file(_topic_index_paths.get(topic_id) or f"by-topic/{topic_id}/index.json")
+            topic_index: TopicIndex = _json_loads(data)
+            _prune_cache(_topic_index_cache, INDEX_CACHE_SIZE)
+            _topic_index_cache[topic_id] = topic_index
+            return topic_index
+        except Exception as e:
+            _load_locks.pop(("topic", topic_id), None)
+            logger.error(f"Failed to load topic index: {topic_id}", exc_info=True)
+            raise Exception(f"Topic not found: {topic_id}") from e
 
 
 async def load_year_index(year: str) -> YearIndex:
@@ -129,12 +270,23 @@ async def load_year_index(year: str) -> YearIndex:
     Raises:
         Exception: If the year index cannot be loaded.
     """
-    try:
-        data = await read_bundled_file(f"by-year/{year}/index.json")
-        return orjson.loads(data)
-    except Exception as e:
-        logger.error(f"Failed to load year index: {year}", exc_info=True)
-        raise Exception(f"Year not found: {year}") from e
+    if year in _year_index_cache:
+        return _year_index_cache[year]
+
+    async with _load_locks[("year", year)]:
+        if year in _year_index_cache:
+            return _year_index_cache[year]
+
+        try:
+            data = await read_bundled_file(_year_index_paths.get(year) or f"by-year/{year}/index.json")
+            year_index: YearIndex = _json_loads(data)
+            _prune_cache(_year_index_cache, INDEX_CACHE_SIZE)
+            _year_index_cache[year] = year_index
+            return year_index
+        except Exception as e:
+            _load_locks.pop(("year", year), None)
+            logger.error(f"Failed to load year index: {year}", exc_info=True)
+            raise Exception(f"Year not found: {year}") from e
 
 
 async def load_video_data(year: str, video_id: str) -> WWDCVideo:
@@ -151,19 +303,51 @@ async def load_video_data(year: str, video_id: str) -> WWDCVideo:
     Raises:
         Exception: If the video data cannot be loaded.
     """
-    cache_key = f"{year}-{video_id}"
+    cache_key = (year, video_id)
     if cache_key in _video_data_cache:
         return _video_data_cache[cache_key]
 
-    try:
-        data = await read_bundled_file(f"videos/{year}-{video_id}.json")
-        video: WWDCVideo = orjson.loads(data)
-        _prune_cache(_video_data_cache)
-        _video_data_cache[cache_key] = video
-        return video
-    except Exception as e:
-        logger.error(f"Failed to load video: {year}-{video_id}", exc_info=True)
-        raise Exception(f"Video not found: {year}-{video_id}") from e
+    async with _load_locks[("video", cache_key)]:
+        if cache_key in _video_data_cache:
+            return _video_data_cache[cache_key]
+
+        try:
+            video: WWDCVideo
+            index, mapped = await _get_video_bundle()
+            if mapped is not None and (span := index.get(f"{year}-{video_id}")) is not None:
+                offset, length = span
+                video = pickle.loads(memoryview(mapped)[offset : offset + length])
+            else:
+                video = _json_loads(await read_bundled_file(f"videos/{year}-{video_id}.json"))
+            _prune_cache(_video_data_cache)
+            _video_data_cache[cache_key] = video
+            return video
+        except Exception as e:
+            _load_locks.pop(("video", cache_key), None)
+            logger.error(f"Failed to load video: {year}-{video_id}", exc_info=True)
+            raise Exception(f"Video not found: {year}-{video_id}") from e
+
+
+async def load_videos_bulk(keys: list[tuple[str, str]]) -> list[WWDCVideo]:
+    """
+    Load detailed data for many videos concurrently.
+
+    Reads are bounded by a module-wide semaphore so concurrent callers share the
+    same disk/thread-pool budget.
+
+    Args:
+        keys: List of (year, video_id) tuples.
+
+    Returns:
+        The loaded videos in input order. Videos that fail to load are skipped.
+    """
+
+    async def load_with_sem(year: str, video_id: str) -> WWDCVideo:
+        async with _disk_sem:
+            return await load_video_data(year, video_id)
+
+    results = await asyncio.gather(*(load_with_sem(year, video_id) for year, video_id in keys), return_exceptions=True)
+    return [res for res in results if not isinstance(res, BaseException)]
 
 
 async def load_all_videos() -> list[WWDCVideo]:
@@ -180,34 +364,25 @@ async def load_all_videos() -> list[WWDCVideo]:
     if _all_videos_cache:
         return _all_videos_cache
 
-    try:
-        data = await read_bundled_file("all-videos.json")
-        # all-videos.json has structure {"videos": [...]}
-        parsed = orjson.loads(data)
-        videos: list[WWDCVideo] = parsed.get("videos", [])
-        # Sort videos by year descending to prioritize recent content
-        videos.sort(key=lambda x: x.get("year", ""), reverse=True)
-        _all_videos_cache = videos
-
-        # Build indices
-        _videos_by_year_cache = {}
-        _videos_by_topic_cache = {}
-
-        for video in videos:
-            year = video["year"]
-            if year not in _videos_by_year_cache:
-                _videos_by_year_cache[year] = []
-            _videos_by_year_cache[year].append(video)
-
-            for topic in video.get("topics", []):
-                if topic not in _videos_by_topic_cache:
-                    _videos_by_topic_cache[topic] = []
-                _videos_by_topic_cache[topic].append(video)
-
-        return _all_videos_cache  # type: ignore
-    except Exception as e:
-        logger.error("Failed to load all videos", exc_info=True)
-        raise Exception("Failed to load WWDC video list") from e
+    async with _all_videos_lock:
+        if _all_videos_cache:
+            return _all_videos_cache
+
+        try:
+            snapshot = await asyncio.to_thread(_read_videos_snapshot)
+            if snapshot is not None:
+                _all_videos_cache, _videos_by_year_cache, _videos_by_topic_cache = snapshot
+                return _all_videos_cache
+
+            data = await read_bundled_file("all-videos.json")
+            # all-videos.json has structure {"videos": [...]}
+            parsed = _json_loads(data)
+            _all_videos_cache, _videos_by_year_cache, _videos_by_topic_cache = index_videos(parsed.get("videos", []))
+
+            return _all_videos_cache  # type: ignore
+        except Exception as e:
+            logger.error("Failed to load all videos", exc_info=True)
+            raise Exception("Failed to load WWDC video list") from e
 
 
 async def get_videos_by_year(year: str) -> list[WWDCVideo]:
@@ -222,10 +397,39 @@ async def get_videos_by_topic(topic: str) -> list[WWDCVideo]:
     return _videos_by_topic_cache.get(topic, [])
 
 
+async def _load_indices() -> None:
+    """Load every topic and year index listed in the global metadata."""
+    metadata = await load_global_metadata()
+    await asyncio.gather(
+        *(load_topic_index(topic["id"]) for topic in metadata["topics"]),
+        *(load_year_index(year) for year in metadata["years"]),
+    )
+
+
+async def warmup() -> None:
+    """
+    Prime the WWDC caches by loading the bundled data concurrently.
+
+    The global metadata, the full video list and the topic/year indices are read
+    in parallel, so the first tool calls are served from memory. Failures are
+    logged and left for the regular loaders to report.
+    """
+    if not is_data_available():
+        return
+
+    results = await asyncio.gather(load_global_metadata(), load_all_videos(), _load_indices(), return_exceptions=True)
+    for res in results:
+        if isinstance(res, Exception):
+            logger.warning("Failed to warm up WWDC data", exc_info=res)
+
+
+@functools.cache
 def is_data_available() -> bool:
     """
     Check if the WWDC data is available locally.
 
+    The bundled data never changes while the server runs, so the result is computed once.
+
     Returns:
         True if the data directory and index.json exist, False otherwise.
     """
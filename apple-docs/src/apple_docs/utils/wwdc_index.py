@@ -0,0 +1,42 @@
+from collections import defaultdict
+from operator import itemgetter
+import sys
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from apple_docs.types.wwdc import WWDCVideo
+
+# The video list sorted by year (newest first), and the same videos grouped by year and by topic
+type VideoIndices = tuple[list[WWDCVideo], dict[str, list[WWDCVideo]], dict[str, list[WWDCVideo]]]
+
+
+def index_videos(videos: list[WWDCVideo]) -> VideoIndices:
+    """
+    Sort the video list and build the by-year and by-topic indices.
+
+    Shared by load_all_videos and the wheel build hook, which pickles the result,
+    so this module imports nothing outside the standard library at runtime.
+
+    Args:
+        videos: The videos from all-videos.json; sorted and updated in place.
+
+    Returns:
+        The sorted videos and the by-year and by-topic indices.
+    """
+    # Sort videos by year descending to prioritize recent content
+    videos.sort(key=itemgetter("year"), reverse=True)
+
+    # Build indices in a single pass, interning the low-cardinality year and
+    # topic strings so every video shares one copy of each
+    by_year: defaultdict[str, list[WWDCVideo]] = defaultdict(list)
+    by_topic: defaultdict[str, list[WWDCVideo]] = defaultdict(list)
+    for video in videos:
+        year = video["year"] = sys.intern(video["year"])
+        by_year[year].append(video)
+        if "topics" in video:
+            topics = video["topics"] = [sys.intern(topic) for topic in video["topics"]]
+            for topic in topics:
+                by_topic[topic].append(video)
+
+    return videos, dict(by_year), dict(by_topic)
@@ -4,8 +4,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import orjson
 import uvicorn
@@ -21,6 +24,8 @@ if _dotenv_path:
 else:
     load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Initialize FastMCP server for mem0 tools
 mcp = FastMCP("mem0")
 
@@ -31,6 +36,8 @@ _project_configured = False
 _project_config_lock = asyncio.Lock()
 
 DEFAULT_AGENT_ID = "mem0-mcp"
+# Upper bound on concurrent mem0 API calls made by a single bulk add
+BULK_ADD_CONCURRENCY = 8
 CUSTOM_INSTRUCTIONS = """
 Extract the Following Information:
 
@@ -77,6 +84,58 @@ async def _ensure_project_config() -> None:
         _project_configured = True
 
 
+async def _add_text(client: AsyncMemoryClient, text: str) -> None:
+    """Store a single text as a user message under the default agent."""
+    await client.add(
+        [{"role": "user", "content": text}],
+        version="v2",
+        agent_id=DEFAULT_AGENT_ID,
+        output_format="v1.1",
+    )
+
+
+def _error_status(e: Exception) -> dict[str, str]:
+    """Format a tool failure as a status payload."""
+    return {"status": "error", "error": str(e)}
+
+
+def _error_text(e: Exception) -> str:
+    """Format a tool failure as a plain-text message."""
+    return f"Error getting preferences: {str(e)}"
+
+
+def _mem0_tool[**P, R](
+    on_error: Callable[[Exception], R],
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Turn exceptions raised by a tool into the result built by on_error.
+
+    Apply below @mcp.tool so FastMCP registers the wrapped function; functools.wraps keeps the
+    original signature for the tool schema.
+    """
+
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.warning(f"{fn.__name__} failed", exc_info=True)
+                return on_error(e)
+
+        return wrapper
+
+    return decorator
+
+
+def _to_json(value: object) -> str:
+    """Serialize a tool result to a JSON string.
+
+    FastMCP passes str results through as text content but re-serializes anything else
+    (including bytes) with pydantic, so the orjson output is decoded once here.
+    """
+    return orjson.dumps(value).decode("utf-8")
+
+
 @mcp.tool(
     description="""Add a new coding preference to mem0. This tool stores code snippets, implementation details,
     and coding patterns for future reference. Store every code snippet. When storing code, you should include:
@@ -92,6 +151,7 @@ async def _ensure_project_config() -> None:
     - Error handling and debugging tips
     The preference will be indexed for semantic search and can be retrieved later using natural language queries."""
 )
+@_mem0_tool(_error_status)
 async def add_coding_preference(text: str) -> dict[str, str]:
     """Add a new coding preference to mem0.
 
@@ -106,19 +166,48 @@ async def add_coding_preference(text: str) -> dict[str, str]:
     Args:
         text: The content to store in memory, including code, documentation, and context
     """
-    try:
-        await _ensure_project_config()
-        client = await _get_mem0_client()
-        messages = [{"role": "user", "content": text}]
-        await client.add(
-            messages,
-            version="v2",
-            agent_id=DEFAULT_AGENT_ID,
-            output_format="v1.1",
-        )
-        return {"status": "ok", "message": "Preference added"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
+    await _ensure_project_config()
+    client = await _get_mem0_client()
+    await _add_text(client, text)
+    return {"status": "ok", "message": "Preference added"}
+
+
+@mcp.tool(
+    description="""Add several coding preferences to mem0 at once. Use this instead of repeated
+    add_coding_preference calls when storing multiple snippets or patterns; each text is stored
+    as its own preference and up to 8 requests are sent concurrently. Follow the same content
+    guidelines as add_coding_preference for every item. If some items fail, the response lists
+    their indices in "failed"; retry only those items, since the others were stored."""
+)
+@_mem0_tool(_error_status)
+async def add_coding_preferences_bulk(texts: list[str]) -> dict[str, Any]:
+    """Add multiple coding preferences to mem0 with bounded concurrency.
+
+    Args:
+        texts: The contents to store, one preference per item
+    """
+    await _ensure_project_config()
+    client = await _get_mem0_client()
+    semaphore = asyncio.Semaphore(BULK_ADD_CONCURRENCY)
+
+    async def add(text: str) -> None:
+        async with semaphore:
+            await _add_text(client, text)
+
+    results = await asyncio.gather(*(add(text) for text in texts), return_exceptions=True)
+    failed = [
+        {"index": index, "error": str(result)}
+        for index, result in enumerate(results)
+        if isinstance(result, BaseException)
+    ]
+    if failed:
+        return {
+            "status": "error",
+            "error": f"{len(failed)} of {len(texts)} preferences failed",
+            "added": len(texts) - len(failed),
+            "failed": failed,
+        }
+    return {"status": "ok", "message": f"{len(texts)} preferences added"}
 
 
 @mcp.tool(
@@ -135,6 +224,7 @@ async def add_coding_preference(text: str) -> dict[str, str]:
     - Setup and configuration guides
     Results are returned in JSON format with metadata."""
 )
+@_mem0_tool(_error_text)
 async def get_all_coding_preferences() -> str:
     """Get all coding preferences for the default user.
 
@@ -145,17 +235,13 @@ async def get_all_coding_preferences() -> str:
     - Setup guides and examples
     Each preference includes metadata about when it was created and its content type.
     """
-    await _ensure_project_config()
-    try:
-        client = await _get_mem0_client()
-        memories = await client.get_all(
-            version="v2",
-            page=1,
-            filters={"AND": [{"agent_id": DEFAULT_AGENT_ID}]},
-        )
-        return orjson.dumps(list(memories)).decode("utf-8")
-    except Exception as e:
-        return f"Error getting preferences: {str(e)}"
+    client = await _get_mem0_client()
+    memories = await client.get_all(
+        version="v2",
+        page=1,
+        filters={"AND": [{"agent_id": DEFAULT_AGENT_ID}]},
+    )
+    return _to_json(list(memories))
 
 
 @mcp.tool(
@@ -170,6 +256,7 @@ async def get_all_coding_preferences() -> str:
     describe what you're looking for in plain English. Always search the preferences before
     providing answers to ensure you leverage existing knowledge."""
 )
+@_mem0_tool(_error_text)
 async def search_coding_preferences(query: str) -> str:
     """Search coding preferences using semantic search.
 
@@ -184,19 +271,15 @@ async def search_coding_preferences(query: str) -> str:
         query: Search query string describing what you're looking for. Can be natural language
               or specific technical terms.
     """
-    await _ensure_project_config()
-    try:
-        client = await _get_mem0_client()
-        memories = await client.search(
-            query,
-            agent_id=DEFAULT_AGENT_ID,
-            version="v2",
-            output_format="v1.1",
-            filters={"AND": [{"agent_id": DEFAULT_AGENT_ID}]},
-        )
-        return orjson.dumps(list(memories)).decode("utf-8")
-    except Exception as e:
-        return f"Error getting preferences: {str(e)}"
+    client = await _get_mem0_client()
+    memories = await client.search(
+        query,
+        agent_id=DEFAULT_AGENT_ID,
+        version="v2",
+        output_format="v1.1",
+        filters={"AND": [{"agent_id": DEFAULT_AGENT_ID}]},
+    )
+    return _to_json(list(memories))
 
 
 def main() -> None:
@@ -226,17 +309,16 @@ def main() -> None:
     if not use_http and (args.host or args.port):
         parser.error("Host and port arguments are only valid when using streamable HTTP transport (see: --http).")
 
-    match use_http:
-        case True:
-            # Use FastMCP's built-in Streamable HTTP app
-            starlette_app = mcp.streamable_http_app()
-            uvicorn.run(
-                starlette_app,
-                host=args.host if args.host else "127.0.0.1",
-                port=args.port if args.port else 3001,
-            )
-        case _:
-            mcp.run(transport="stdio")
+    if use_http:
+        # Use FastMCP's built-in Streamable HTTP app
+        starlette_app = mcp.streamable_http_app()
+        uvicorn.run(
+            starlette_app,
+            host=args.host if args.host else "127.0.0.1",
+            port=args.port if args.port else 3001,
+        )
+    else:
+        mcp.run(transport="stdio")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,34 @@
 """Vertex Memory Bank MCP server package."""
 
-from . import clients, errors, formatters, services, validators
-from .server import run
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from . import clients, errors, formatters, services, validators
+    from .server import run
+
+# Submodules pull in the Vertex AI SDK, so they are imported on first access (PEP 562)
+_LAZY_SUBMODULES = frozenset({"clients", "errors", "formatters", "services", "validators"})
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and the server entry point on first attribute access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name == "run":
+        from .server import run
+
+        return run
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
     """Entry point for the `vertex-memory-bank` console script."""
+    from .server import run
+
     run()
 
 
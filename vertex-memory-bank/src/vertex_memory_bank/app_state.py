@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from .services import MemoryBankService
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Holds mutable context shared by MCP tools and server lifecycle."""
 
@@ -23,12 +23,7 @@ class AppState:
 
     def is_ready(self) -> bool:
         """Return True when both the Vertex client and agent engine are available."""
-        if self.client_manager is None:
-            return False
-        return (
-            self.client_manager.client is not None
-            and self.client_manager.agent_engine_name is not None
-        )
+        return self.client_manager is not None and self.client_manager.ready
 
     def reset(self) -> None:
         """Clear cached clients and agent state."""
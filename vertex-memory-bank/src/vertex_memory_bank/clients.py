@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict, defaultdict
 from collections.abc import Iterable
-from dataclasses import dataclass
+import copy
+from dataclasses import dataclass, field, replace
+import functools
 import logging
-from typing import Any, cast
+import os
+import time
+from typing import TYPE_CHECKING, Any
 
+import httpx
 import vertexai
 
 from .concurrency import run_blocking
@@ -15,14 +22,88 @@ from .engines import extract_agent_engine_name
 from .errors import InitializationError
 
 
-vertexai = cast(Any, vertexai)
-VertexClient = Any
+if TYPE_CHECKING:
+    from vertexai import Client as VertexClient
+
+_VERTEX_CLIENT_CTOR = vertexai.Client
 
 
 logger = logging.getLogger(__name__)
 
 _NOT_INITIALIZED_MESSAGE = "Memory Bank not initialized. Call initialize_memory_bank first."
 
+# Authenticated clients keyed by (project_id, location), stored with their creation time so
+# re-initialization reuses the client and its OAuth token until roughly one token lifetime passes.
+# Kept in least-recently-used order and capped, since each client holds its own transport.
+CLIENT_CACHE_TTL = 3600.0
+CLIENT_CACHE_SIZE = 8
+_client_cache: OrderedDict[tuple[str, str], tuple[VertexClient, float]] = OrderedDict()
+# Per-key locks so concurrent callers for the same project/location authenticate only once
+_client_locks: defaultdict[tuple[str, str], asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Opt-in keep-alive pool for the SDK's synchronous httpx transport, whose default keeps only 20 idle
+# connections for 5 seconds. Passing client_args makes google-genai skip its google-auth
+# AuthorizedSession, which handles mTLS with default client certificates, so it stays off by default.
+_HTTP_POOL_SIZE = int(os.getenv("VERTEX_HTTP_POOL_SIZE", "0"))
+_HTTP_OPTIONS: dict[str, Any] | None = (
+    {
+        "client_args": {
+            "limits": httpx.Limits(
+                max_connections=_HTTP_POOL_SIZE,
+                max_keepalive_connections=_HTTP_POOL_SIZE,
+                keepalive_expiry=30.0,
+            ),
+        },
+    }
+    if _HTTP_POOL_SIZE > 0
+    else None
+)
+
+
+def _cached_client(key: tuple[str, str]) -> VertexClient | None:
+    """Return the cached client for key unless it is missing or expired."""
+    cached = _client_cache.get(key)
+    if cached is None or time.monotonic() - cached[1] >= CLIENT_CACHE_TTL:
+        return None
+    _client_cache.move_to_end(key)
+    return cached[0]
+
+
+def _store_client(key: tuple[str, str], client: VertexClient) -> None:
+    """Cache a freshly built client, evicting the least recently used entries over the cap."""
+    _client_cache[key] = (client, time.monotonic())
+    _client_cache.move_to_end(key)
+    while len(_client_cache) > CLIENT_CACHE_SIZE:
+        evicted, _ = _client_cache.popitem(last=False)
+        _client_locks.pop(evicted, None)
+
+
+@functools.lru_cache(maxsize=32)
+def _creation_config(memory_topics: tuple[str, ...]) -> dict[str, Any]:
+    """Build the Memory Bank creation config for a topic list, reusing it for repeated topic sets.
+
+    The cached dict is shared between callers; use VertexClientManager._build_creation_config,
+    which hands out a copy.
+    """
+    return {
+        "context_spec": {
+            "memory_bank_config": {
+                "customization_configs": [
+                    {
+                        "memory_topics": [
+                            {
+                                "managed_memory_topic": {
+                                    "managed_topic_enum": topic,
+                                }
+                            }
+                            for topic in memory_topics
+                        ]
+                    }
+                ]
+            }
+        }
+    }
+
 
 @dataclass(slots=True)
 class VertexClientManager:
@@ -31,6 +112,13 @@ class VertexClientManager:
     config: Config
     client: VertexClient | None = None
     agent_engine_name: str | None = None
+    # True once both client and agent_engine_name are set; kept in sync by the mutators below
+    ready: bool = field(default=False, init=False)
+    # Keyed by the requested engine name, or None for reuse/create, so lookups of different
+    # engines proceed in parallel while duplicate creates stay single-flight
+    _engine_locks: defaultdict[str | None, asyncio.Lock] = field(
+        default_factory=lambda: defaultdict(asyncio.Lock), init=False, repr=False
+    )
 
     async def bootstrap(self) -> None:
         """Eagerly construct the client/agent engine if the config already has them."""
@@ -51,16 +139,20 @@ class VertexClientManager:
             return self.client
 
         def _build() -> VertexClient:
-            client_ctor = cast(Any, vertexai.Client)
-            return client_ctor(project=project_id, location=location)
-
-        self.client = await run_blocking(_build)
-        self.config = Config(
-            project_id=project_id,
-            location=location,
-            agent_engine_name=self.config.agent_engine_name,
-            credentials_path=self.config.credentials_path,
-        )
+            return _VERTEX_CLIENT_CTOR(project=project_id, location=location, http_options=_HTTP_OPTIONS)
+
+        key = (project_id, location)
+        client = _cached_client(key)
+        if client is None:
+            async with _client_locks[key]:
+                client = _cached_client(key)
+                if client is None:
+                    client = await run_blocking(_build)
+                    _store_client(key, client)
+        self.client = client
+        self.ready = self.agent_engine_name is not None
+        if self.config.project_id != project_id or self.config.location != location:
+            self.config = replace(self.config, project_id=project_id, location=location)
         logger.info("Vertex client refreshed for project %s", project_id)
         return self.client
 
@@ -73,22 +165,26 @@ class VertexClientManager:
     ) -> str:
         """Return an agent-engine resource name, creating one when necessary."""
         client = self.require_client()
-        if existing_name and not force_new:
-            logger.info("Using user-specified Agent Engine %s", existing_name)
-            engine = await run_blocking(client.agent_engines.get, name=existing_name)
-            name = extract_agent_engine_name(engine)
-        elif self.agent_engine_name and not force_new:
-            logger.info("Reusing cached Agent Engine %s", self.agent_engine_name)
-            name = self.agent_engine_name
-        else:
-            creation_config = self._build_creation_config(memory_topics)
-            logger.info("Creating new Agent Engine with Memory Bank enabled")
-            engine = await run_blocking(client.agent_engines.create, config=creation_config)
-            name = extract_agent_engine_name(engine)
-
-        self.agent_engine_name = name
-        self.config = self.config.copy_with_agent_engine(name)
-        return name
+        lock_key = existing_name if existing_name and not force_new else None
+        async with self._engine_locks[lock_key]:
+            if existing_name and not force_new:
+                logger.info("Using user-specified Agent Engine %s", existing_name)
+                engine = await run_blocking(client.agent_engines.get, name=existing_name)
+                name = extract_agent_engine_name(engine)
+            elif self.agent_engine_name and not force_new:
+                logger.info("Reusing cached Agent Engine %s", self.agent_engine_name)
+                name = self.agent_engine_name
+            else:
+                creation_config = self._build_creation_config(memory_topics)
+                logger.info("Creating new Agent Engine with Memory Bank enabled")
+                engine = await run_blocking(client.agent_engines.create, config=creation_config)
+                name = extract_agent_engine_name(engine)
+
+            self.agent_engine_name = name
+            self.ready = True
+            if self.config.agent_engine_name != name:
+                self.config = self.config.copy_with_agent_engine(name)
+            return name
 
     def require_client(self) -> VertexClient:
         """Return the cached client or raise an initialization error."""
@@ -110,26 +206,10 @@ class VertexClientManager:
         """Clear cached state so a fresh configuration can be applied."""
         self.client = None
         self.agent_engine_name = None
+        self.ready = False
 
     @staticmethod
     def _build_creation_config(memory_topics: Iterable[str] | None) -> dict[str, Any] | None:
         if not memory_topics:
             return None
-        return {
-            "context_spec": {
-                "memory_bank_config": {
-                    "customization_configs": [
-                        {
-                            "memory_topics": [
-                                {
-                                    "managed_memory_topic": {
-                                        "managed_topic_enum": topic,
-                                    }
-                                }
-                                for topic in memory_topics
-                            ]
-                        }
-                    ]
-                }
-            }
-        }
+        return copy.deepcopy(_creation_config(tuple(memory_topics)))
@@ -3,19 +3,25 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 from collections.abc import Callable
-import functools
-from typing import Any, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import Any
 
 
-T = TypeVar("T")
-
-
-def _partial[T](func: Callable[..., T], *args: Any, **kwargs: Any) -> Callable[[], T]:
-    return functools.partial(func, *args, **kwargs)
+# Vertex SDK calls are network-bound and can take seconds, so they get their own pool instead of
+# sharing the loop's default executor (min(32, cpus + 4) workers)
+_VERTEX_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("VERTEX_MAX_WORKERS", "64")),
+    thread_name_prefix="vertex",
+)
+atexit.register(_VERTEX_POOL.shutdown, wait=False)
 
 
 async def run_blocking[T](func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
-    """Execute a blocking callable on the default executor without stalling the loop."""
+    """Execute a blocking callable on the Vertex thread pool without stalling the loop."""
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, _partial(func, *args, **kwargs))
+    if not kwargs:
+        return await loop.run_in_executor(_VERTEX_POOL, func, *args)
+    return await loop.run_in_executor(_VERTEX_POOL, lambda: func(*args, **kwargs))
@@ -2,38 +2,49 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, replace
+import functools
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
 
 
 load_dotenv()
 
 
-class Config(BaseModel):
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> tuple[str, str, str | None, str | None]:
+    """Read the configuration variables once; call _env_snapshot.cache_clear() to re-read them."""
+    return (
+        os.getenv("GOOGLE_CLOUD_PROJECT", ""),
+        os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1"),
+        os.getenv("AGENT_ENGINE_NAME"),
+        os.getenv("GOOGLE_APPLICATION_CREDENTIALS"),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
     """Parsed configuration derived from environment variables."""
 
-    project_id: str = Field(default="", description="Google Cloud project ID")
-    location: str = Field(default="us-central1", description="Vertex AI location")
-    agent_engine_name: str | None = Field(
-        default=None,
-        description="Existing Agent Engine resource name",
-    )
-    credentials_path: Path | None = Field(
-        default=None,
-        description="Path to service-account JSON credentials",
-    )
+    # Google Cloud project ID
+    project_id: str = ""
+    # Vertex AI location
+    location: str = "us-central1"
+    # Existing Agent Engine resource name
+    agent_engine_name: str | None = None
+    # Path to service-account JSON credentials
+    credentials_path: Path | None = None
 
     @classmethod
     def from_env(cls) -> Config:
         """Create a Config instance from process environment variables."""
-        credentials = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+        project_id, location, agent_engine_name, credentials = _env_snapshot()
         return cls(
-            project_id=os.getenv("GOOGLE_CLOUD_PROJECT", ""),
-            location=os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1"),
-            agent_engine_name=os.getenv("AGENT_ENGINE_NAME"),
+            project_id=project_id,
+            location=location,
+            agent_engine_name=agent_engine_name,
             credentials_path=Path(credentials) if credentials else None,
         )
 
@@ -43,6 +54,4 @@ class Config(BaseModel):
 
     def copy_with_agent_engine(self, agent_engine_name: str) -> Config:
         """Return a new Config with the given agent engine resource name."""
-        data = self.model_dump()
-        data["agent_engine_name"] = agent_engine_name
-        return Config(**data)
+        return replace(self, agent_engine_name=agent_engine_name)
@@ -7,12 +7,12 @@ from typing import Any
 
 def extract_agent_engine_name(engine: Any) -> str:
     """Return the fully qualified resource name for an Agent Engine."""
-    candidates = [engine]
-    for attr in ("api_resource", "result", "_pb"):
-        nested = getattr(engine, attr, None)
-        if nested is not None:
-            candidates.append(nested)
-    for candidate in candidates:
+    for candidate in (
+        engine,
+        getattr(engine, "api_resource", None),
+        getattr(engine, "result", None),
+        getattr(engine, "_pb", None),
+    ):
         name = getattr(candidate, "name", None)
         if name:
             return str(name)
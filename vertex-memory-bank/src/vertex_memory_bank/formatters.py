@@ -4,30 +4,45 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
+from operator import attrgetter
 from typing import Any
 
 
+_MEMORY_FIELDS = ("name", "fact", "scope", "created_time", "updated_time")
+_get_memory_fields = attrgetter(*_MEMORY_FIELDS)
+
+
+def _safe_get(obj: Any, attr: str) -> Any:
+    value = getattr(obj, attr, None)
+    if value is not None:
+        return value
+    api_resource = getattr(obj, "api_resource", None)
+    if api_resource is not None:
+        return getattr(api_resource, attr, None)
+    return None
+
+
 def format_memory(memory: Any) -> dict[str, Any]:
     """Convert a Vertex memory object into a serializable dictionary."""
     if memory is None:
         return {"status": "empty"}
 
-    def _safe_get(obj: Any, attr: str) -> Any:
-        value = getattr(obj, attr, None)
-        if value is not None:
-            return value
-        api_resource = getattr(obj, "api_resource", None)
-        if api_resource is not None:
-            return getattr(api_resource, attr, None)
-        return None
-
     memory_obj = getattr(memory, "memory", memory)
+    try:
+        values = _get_memory_fields(memory_obj)
+    except AttributeError:
+        values = None
+    # Fall back to per-field lookups (including api_resource) only when the direct read is incomplete
+    if values is None or None in values:
+        values = tuple(_safe_get(memory_obj, attr) for attr in _MEMORY_FIELDS)
+
+    name, fact, scope, created_time, updated_time = values
     return {
-        "name": _safe_get(memory_obj, "name"),
-        "fact": _safe_get(memory_obj, "fact"),
-        "scope": _safe_get(memory_obj, "scope"),
-        "created_time": str(_safe_get(memory_obj, "created_time")),
-        "updated_time": str(_safe_get(memory_obj, "updated_time")),
+        "name": name,
+        "fact": fact,
+        "scope": scope,
+        "created_time": str(created_time),
+        "updated_time": str(updated_time),
     }
 
 
@@ -64,10 +79,11 @@ def format_success_response(data: dict[str, Any] | None = None, *, message: str
 
 def format_ttl_expiration(ttl_seconds: int) -> str:
     """Return an RFC3339 timestamp representing ttl_seconds in the future."""
-    expiration = datetime.now(tz=UTC) + timedelta(seconds=ttl_seconds)
-    return expiration.isoformat().replace("+00:00", "Z")
+    # Naive UTC so isoformat emits no offset and the "Z" suffix can be appended directly
+    expiration = datetime.now(tz=UTC).replace(tzinfo=None) + timedelta(seconds=ttl_seconds)
+    return expiration.isoformat(timespec="microseconds") + "Z"
 
 
 def serialize_memories(memories: Iterable[Any]) -> list[dict[str, Any]]:
     """Serialize an iterable of Vertex memories into plain dictionaries."""
-    return [format_memory(memory) for memory in memories]
+    return list(map(format_memory, memories))
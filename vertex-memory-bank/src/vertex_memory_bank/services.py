@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from itertools import chain
 import logging
 from typing import Any, TypeVar
 
@@ -31,6 +32,8 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+_EXHAUSTED = object()
+
 
 @dataclass(slots=True)
 class MemoryBankService:
@@ -112,9 +115,10 @@ class MemoryBankService:
         self._raise_on_error(validate_top_k(top_k))
         client, agent_name = self.client_manager.require_ready()
 
-        def _retrieve() -> Iterable[Any]:
+        # Pages are fetched and formatted on the executor so pagination never blocks the loop
+        def _retrieve() -> list[dict[str, Any]]:
             if search_query:
-                return client.agent_engines.retrieve_memories(
+                results = client.agent_engines.retrieve_memories(
                     name=agent_name,
                     scope=scope,
                     similarity_search_params={
@@ -122,16 +126,11 @@ class MemoryBankService:
                         "top_k": top_k,
                     },
                 )
-            return client.agent_engines.retrieve_memories(name=agent_name, scope=scope)
-
-        results = await self._call_vertex(_retrieve, "retrieve memories")
+                return self._format_retrieved(results, with_scores=True)
+            results = client.agent_engines.retrieve_memories(name=agent_name, scope=scope)
+            return self._format_retrieved(results, with_scores=False)
 
-        formatted: list[dict[str, Any]] = []
-        for memory in list(results):
-            payload = format_memory(memory)
-            if search_query and hasattr(memory, "distance"):
-                payload["similarity_score"] = memory.distance
-            formatted.append(payload)
+        formatted = await self._call_vertex(_retrieve, "retrieve memories")
 
         return {
             "scope": scope,
@@ -147,7 +146,8 @@ class MemoryBankService:
         ttl_seconds: int | None,
     ) -> dict[str, Any]:
         """Create a manual fact scoped to a particular user/context."""
-        self._raise_on_error(validate_memory_fact(fact))
+        error, stripped = validate_memory_fact(fact)
+        self._raise_on_error(error)
         self._raise_on_error(validate_scope(scope))
         client, agent_name = self.client_manager.require_ready()
         expire_time = (
@@ -159,7 +159,7 @@ class MemoryBankService:
         def _create() -> Any:
             return client.agent_engines.create_memory(
                 name=agent_name,
-                fact=fact.strip(),
+                fact=stripped,
                 scope=scope,
                 config={"expire_time": expire_time} if expire_time else None,
             )
@@ -189,7 +189,7 @@ class MemoryBankService:
                 name=agent_name,
                 config={"page_size": page_size} if page_size else None,
             )
-            return serialize_memories(list(pager))
+            return serialize_memories(pager)
 
         memories = await self._call_vertex(_list, "list memories")
         return {"count": len(memories), "memories": memories}
@@ -198,9 +198,9 @@ class MemoryBankService:
         """Execute a blocking Vertex SDK call without stalling the event loop."""
         try:
             return await run_blocking(func)
-        except InitializationError:
-            raise
         except Exception as exc:  # pragma: no cover - network errors
+            if isinstance(exc, InitializationError):
+                raise
             logger.error("Failed to %s: %s", action, exc)
             raise VertexServiceError(str(exc)) from exc
 
@@ -210,6 +210,25 @@ class MemoryBankService:
         if message:
             raise ValidationError(message)
 
+    @staticmethod
+    def _format_retrieved(results: Iterable[Any], *, with_scores: bool) -> list[dict[str, Any]]:
+        """Format retrieved memories in one pass, adding similarity scores when present."""
+        iterator = iter(results)
+        first = next(iterator, _EXHAUSTED)
+        if first is _EXHAUSTED:
+            return []
+        memories = chain((first,), iterator)
+        # Every result of a query has the same type, so probe for distance once
+        if not (with_scores and hasattr(first, "distance")):
+            return serialize_memories(memories)
+
+        formatted: list[dict[str, Any]] = []
+        for memory in memories:
+            payload = format_memory(memory)
+            payload["similarity_score"] = memory.distance
+            formatted.append(payload)
+        return formatted
+
     @staticmethod
     def _extract_generated_memories(result: Any) -> Iterable[Any] | None:
         """Best-effort extraction for Vertex responses with generated memories."""
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+import asyncio
+from collections.abc import Callable
 import logging
 from typing import Any
 
@@ -12,38 +13,107 @@ from .app_state import app_state
 from .errors import InitializationError, MemoryBankError, ValidationError
 from .formatters import format_error_response, format_success_response
 from .services import MemoryBankService
+from .validators import validate_conversation, validate_memory_fact, validate_scope, validate_top_k
 
 
 logger = logging.getLogger(__name__)
 
-ToolCall = Callable[[MemoryBankService], Awaitable[dict[str, Any]]]
+# Service operations accepted by batch_execute: required arguments and the defaults of the matching tool
+_BATCH_OPERATIONS: dict[str, tuple[frozenset[str], dict[str, Any]]] = {
+    "generate_memories": (frozenset({"conversation", "scope"}), {"wait_for_completion": True}),
+    "retrieve_memories": (frozenset({"scope"}), {"search_query": None, "top_k": 5}),
+    "create_memory": (frozenset({"fact", "scope"}), {"ttl_seconds": None}),
+    "delete_memory": (frozenset({"memory_name"}), {}),
+    "list_memories": (frozenset(), {"page_size": 50}),
+}
+
+# Validators run on batch arguments before anything is dispatched, keyed by argument name
+_BATCH_VALIDATORS: dict[str, Callable[[Any], str | None]] = {
+    "conversation": validate_conversation,
+    "scope": validate_scope,
+    "fact": lambda fact: validate_memory_fact(fact)[0],
+    "top_k": lambda top_k: validate_top_k(top_k) if type(top_k) is int else "top_k must be an integer",
+}
+
+
+def _prepare_batch_operation(index: int, operation: Any) -> tuple[str, dict[str, Any]]:
+    """Resolve one batch_execute entry into an operation name and complete keyword arguments."""
+    if not isinstance(operation, dict):
+        raise ValidationError(f"Operation {index} must be a dictionary")
+    name = operation.get("operation")
+    if name not in _BATCH_OPERATIONS:
+        raise ValidationError(f"Operation {index} has unsupported operation {name!r}")
+    arguments = operation.get("arguments") or {}
+    if not isinstance(arguments, dict):
+        raise ValidationError(f"Operation {index} arguments must be a dictionary")
+    required, defaults = _BATCH_OPERATIONS[name]
+    if missing := required - arguments.keys():
+        raise ValidationError(f"Operation {index} is missing {', '.join(sorted(missing))}")
+    if unknown := arguments.keys() - required - defaults.keys():
+        raise ValidationError(f"Operation {index} has unknown arguments {', '.join(sorted(unknown))}")
+    arguments = {**defaults, **arguments}
+    for argument, validator in _BATCH_VALIDATORS.items():
+        if argument in arguments and (error := validator(arguments[argument])):
+            raise ValidationError(f"Operation {index}: {error}")
+    return name, arguments
+
+
+def _service() -> MemoryBankService:
+    """Return the active service or fail if the server has not started it."""
+    service = app_state.memory_service
+    if service is None:
+        raise InitializationError("Memory Bank service not initialized")
+    return service
+
+
+async def _dispatch(method: str, /, **kwargs: Any) -> dict[str, Any]:
+    """Call a MemoryBankService method and wrap its result in a tool response."""
+    try:
+        service = _service()
+        payload = await getattr(service, method)(**kwargs)
+    except ValidationError as exc:
+        return format_error_response(str(exc))
+    except InitializationError as exc:
+        return format_error_response(str(exc))
+    except MemoryBankError as exc:
+        logger.error("Memory Bank operation failed: %s", exc)
+        return format_error_response(str(exc))
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception("Unexpected tool failure: %s", exc)
+        return format_error_response("Unexpected error while processing request")
+    return format_success_response(payload)
+
+
+async def _batch_execute(operations: list[Any], *, max_concurrent: int, stop_on_error: bool) -> dict[str, Any]:
+    """Validate every batch entry up front, then dispatch them with bounded concurrency."""
+    try:
+        if max_concurrent <= 0:
+            raise ValidationError("max_concurrent must be positive")
+        prepared = [_prepare_batch_operation(index, operation) for index, operation in enumerate(operations)]
+    except ValidationError as exc:
+        return format_error_response(str(exc))
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    failed = False
+
+    async def _run(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        nonlocal failed
+        async with semaphore:
+            if stop_on_error and failed:
+                return format_error_response("Skipped after an earlier operation failed")
+            result = await _dispatch(name, **arguments)
+            if result["status"] == "error":
+                failed = True
+            return result
+
+    results = await asyncio.gather(*(_run(name, arguments) for name, arguments in prepared))
+    errors = sum(result["status"] == "error" for result in results)
+    return format_success_response({"results": results, "errors_count": errors})
 
 
 def register_tools(server: FastMCP) -> None:
     """Bind tool handlers to the FastMCP server instance."""
 
-    async def _dispatch(call: ToolCall) -> dict[str, Any]:
-        try:
-            service = _service()
-            payload = await call(service)
-        except ValidationError as exc:
-            return format_error_response(str(exc))
-        except InitializationError as exc:
-            return format_error_response(str(exc))
-        except MemoryBankError as exc:
-            logger.error("Memory Bank operation failed: %s", exc)
-            return format_error_response(str(exc))
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.exception("Unexpected tool failure: %s", exc)
-            return format_error_response("Unexpected error while processing request")
-        return format_success_response(payload)
-
-    def _service() -> MemoryBankService:
-        service = app_state.memory_service
-        if service is None:
-            raise InitializationError("Memory Bank service not initialized")
-        return service
-
     @server.tool()
     async def initialize_memory_bank(
         project_id: str,
@@ -53,13 +123,12 @@ def register_tools(server: FastMCP) -> None:
         force_new_agent_engine: bool = False,
     ) -> dict[str, Any]:
         return await _dispatch(
-            lambda svc: svc.initialize_memory_bank(
-                project_id=project_id,
-                location=location,
-                memory_topics=memory_topics,
-                agent_engine_name=agent_engine_name,
-                force_new_agent_engine=force_new_agent_engine,
-            )
+            "initialize_memory_bank",
+            project_id=project_id,
+            location=location,
+            memory_topics=memory_topics,
+            agent_engine_name=agent_engine_name,
+            force_new_agent_engine=force_new_agent_engine,
         )
 
     @server.tool()
@@ -69,11 +138,10 @@ def register_tools(server: FastMCP) -> None:
         wait_for_completion: bool = True,
     ) -> dict[str, Any]:
         return await _dispatch(
-            lambda svc: svc.generate_memories(
-                conversation=conversation,
-                scope=scope,
-                wait_for_completion=wait_for_completion,
-            )
+            "generate_memories",
+            conversation=conversation,
+            scope=scope,
+            wait_for_completion=wait_for_completion,
         )
 
     @server.tool()
@@ -83,11 +151,10 @@ def register_tools(server: FastMCP) -> None:
         top_k: int = 5,
     ) -> dict[str, Any]:
         return await _dispatch(
-            lambda svc: svc.retrieve_memories(
-                scope=scope,
-                search_query=search_query,
-                top_k=top_k,
-            )
+            "retrieve_memories",
+            scope=scope,
+            search_query=search_query,
+            top_k=top_k,
         )
 
     @server.tool()
@@ -97,20 +164,34 @@ def register_tools(server: FastMCP) -> None:
         ttl_seconds: int | None = None,
     ) -> dict[str, Any]:
         return await _dispatch(
-            lambda svc: svc.create_memory(
-                fact=fact,
-                scope=scope,
-                ttl_seconds=ttl_seconds,
-            )
+            "create_memory",
+            fact=fact,
+            scope=scope,
+            ttl_seconds=ttl_seconds,
         )
 
     @server.tool()
     async def delete_memory(memory_name: str) -> dict[str, Any]:
-        return await _dispatch(lambda svc: svc.delete_memory(memory_name=memory_name))
+        return await _dispatch("delete_memory", memory_name=memory_name)
 
     @server.tool()
     async def list_memories(page_size: int = 50) -> dict[str, Any]:
-        return await _dispatch(lambda svc: svc.list_memories(page_size=page_size))
+        return await _dispatch("list_memories", page_size=page_size)
+
+    @server.tool()
+    async def batch_execute(
+        operations: list[dict[str, Any]],
+        max_concurrent: int = 8,
+        stop_on_error: bool = False,
+    ) -> dict[str, Any]:
+        """Run several memory operations concurrently in one call.
+
+        Each entry is {"operation": <tool name>, "arguments": {...}} for generate_memories,
+        retrieve_memories, create_memory, delete_memory or list_memories. Every entry is validated
+        before any operation runs. Results are returned in input order; with stop_on_error,
+        operations not yet started after a failure are skipped.
+        """
+        return await _batch_execute(operations, max_concurrent=max_concurrent, stop_on_error=stop_on_error)
 
     _ = (
         initialize_memory_bank,
@@ -119,4 +200,5 @@ def register_tools(server: FastMCP) -> None:
         create_memory,
         delete_memory,
         list_memories,
+        batch_execute,
     )
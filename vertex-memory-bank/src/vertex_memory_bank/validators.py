@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from typing import Annotated, Literal, TypedDict
 
+from pydantic import StringConstraints, TypeAdapter, ValidationError as PydanticValidationError
 
-_VALID_ROLES = {"user", "assistant", "system"}
+
+class _Turn(TypedDict):
+    role: Literal["user", "assistant", "system"]
+    content: Annotated[str, StringConstraints(min_length=1)]
+
+
+# Compiled once; pydantic-core validates every turn/entry in Rust instead of a Python loop
+_CONVERSATION_ADAPTER = TypeAdapter(list[_Turn])
+_SCOPE_ADAPTER = TypeAdapter(dict[str, str])
 
 
 def validate_scope(scope: dict[str, str]) -> str | None:
@@ -14,9 +24,10 @@ def validate_scope(scope: dict[str, str]) -> str | None:
         return "Scope must be a dictionary"
     if not scope:
         return "Scope cannot be empty"
-    for key, value in scope.items():
-        if not isinstance(key, str) or not isinstance(value, str):
-            return "Scope keys and values must be strings"
+    try:
+        _SCOPE_ADAPTER.validate_python(scope, strict=True)
+    except PydanticValidationError:
+        return "Scope keys and values must be strings"
     return None
 
 
@@ -26,27 +37,29 @@ def validate_conversation(conversation: list[dict[str, str]]) -> str | None:
         return "Conversation must be a list"
     if not conversation:
         return "Conversation cannot be empty"
-    for index, turn in enumerate(conversation):
-        if not isinstance(turn, dict):
+    try:
+        _CONVERSATION_ADAPTER.validate_python(conversation, strict=True)
+    except PydanticValidationError as exc:
+        # Errors are reported in input order, then role before content within a turn
+        index, *field = exc.errors()[0]["loc"]
+        if not field:
             return f"Turn {index} must be a dictionary"
-        role = turn.get("role")
-        if role not in _VALID_ROLES:
+        if field[0] == "role":
             return f"Turn {index} has invalid role"
-        content = turn.get("content")
-        if not content or not isinstance(content, str):
-            return f"Turn {index} must include non-empty content"
+        return f"Turn {index} must include non-empty content"
     return None
 
 
-def validate_memory_fact(fact: str) -> str | None:
-    """Ensure that facts are non-empty and bounded."""
+def validate_memory_fact(fact: str) -> tuple[str | None, str]:
+    """Ensure that facts are non-empty and bounded, returning the error and the stripped fact."""
     if not isinstance(fact, str):
-        return "Fact must be a string"
-    if not fact.strip():
-        return "Fact cannot be empty"
+        return "Fact must be a string", ""
     if len(fact) > 10_000:
-        return "Fact exceeds 10k character limit"
-    return None
+        return "Fact exceeds 10k character limit", ""
+    stripped = fact.strip()
+    if not stripped:
+        return "Fact cannot be empty", ""
+    return None, stripped
 
 
 def validate_memory_topics(topics: Iterable[str] | None) -> str | None:
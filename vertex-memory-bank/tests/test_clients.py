@@ -0,0 +1,101 @@
+"""Tests for the shared Vertex client cache."""
+
+import asyncio
+from collections import OrderedDict, defaultdict
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from vertex_memory_bank import clients
+from vertex_memory_bank.config import Config
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    # Patch the module's view of time only, so the event loop keeps the real clock
+    monkeypatch.setattr(clients, "time", fake)
+    monkeypatch.setattr(clients, "_client_cache", OrderedDict())
+    monkeypatch.setattr(clients, "_client_locks", defaultdict(asyncio.Lock))
+    return fake
+
+
+@pytest.fixture
+def builds(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    built: list[tuple[str, str]] = []
+
+    def build(*, project: str, location: str, **_: Any) -> SimpleNamespace:
+        built.append((project, location))
+        return SimpleNamespace(project=project, location=location)
+
+    monkeypatch.setattr(clients, "_VERTEX_CLIENT_CTOR", build)
+    return built
+
+
+def get_client(project_id: str, location: str = "us-central1") -> Any:
+    manager = clients.VertexClientManager(Config())
+    return asyncio.run(manager.ensure_client(project_id, location))
+
+
+@pytest.mark.usefixtures("clock")
+def test_client_is_reused_within_ttl(builds: list[tuple[str, str]]) -> None:
+    first = get_client("p1")
+    assert get_client("p1") is first
+    assert builds == [("p1", "us-central1")]
+
+
+def test_client_is_rebuilt_after_ttl(clock: FakeClock, builds: list[tuple[str, str]]) -> None:
+    first = get_client("p1")
+    clock.now += clients.CLIENT_CACHE_TTL - 1
+    assert get_client("p1") is first
+    clock.now += 1
+    assert get_client("p1") is not first
+    assert builds == [("p1", "us-central1")] * 2
+
+
+@pytest.mark.usefixtures("clock")
+def test_least_recently_used_client_is_evicted_at_capacity(
+    monkeypatch: pytest.MonkeyPatch, builds: list[tuple[str, str]]
+) -> None:
+    monkeypatch.setattr(clients, "CLIENT_CACHE_SIZE", 2)
+    first = get_client("p1")
+    get_client("p2")
+    assert get_client("p1") is first  # p1 becomes the most recently used entry
+    get_client("p3")
+
+    assert list(clients._client_cache) == [("p1", "us-central1"), ("p3", "us-central1")]
+    assert ("p2", "us-central1") not in clients._client_locks
+    get_client("p2")
+    assert builds == [("p1", "us-central1"), ("p2", "us-central1"), ("p3", "us-central1"), ("p2", "us-central1")]
+
+
+@pytest.mark.usefixtures("clock")
+def test_concurrent_requests_for_one_key_build_once(builds: list[tuple[str, str]]) -> None:
+    async def scenario() -> list[Any]:
+        managers = [clients.VertexClientManager(Config()) for _ in range(4)]
+        return await asyncio.gather(*(manager.ensure_client("p1", "us-central1") for manager in managers))
+
+    results = asyncio.run(scenario())
+    assert all(result is results[0] for result in results)
+    assert builds == [("p1", "us-central1")]
+
+
+def test_creation_config_is_not_shared_between_callers() -> None:
+    first = clients.VertexClientManager._build_creation_config(["USER_PREFERENCES"])
+    assert first is not None
+    first["context_spec"]["memory_bank_config"]["customization_configs"].clear()
+
+    second = clients.VertexClientManager._build_creation_config(["USER_PREFERENCES"])
+    assert second is not None
+    assert second["context_spec"]["memory_bank_config"]["customization_configs"] == [
+        {"memory_topics": [{"managed_memory_topic": {"managed_topic_enum": "USER_PREFERENCES"}}]}
+    ]
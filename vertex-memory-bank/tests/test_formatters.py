@@ -20,6 +20,16 @@ def test_format_memory_handles_simple_objects() -> None:
     assert payload["scope"] == {"user_id": "abc"}
 
 
+def test_format_memory_falls_back_to_api_resource() -> None:
+    wrapper = MemoryStub()
+    wrapper.fact = None  # type: ignore[assignment]
+    wrapper.api_resource = MemoryStub()  # type: ignore[attr-defined]
+    wrapper.api_resource.fact = "Stored on the API resource"  # type: ignore[attr-defined]
+    payload = formatters.format_memory(wrapper)
+    assert payload["fact"] == "Stored on the API resource"
+    assert payload["name"] == "projects/p/locations/l/memories/1"
+
+
 def test_format_conversation_events_maps_turns() -> None:
     events = formatters.format_conversation_events([
         {"role": "user", "content": "Hello"},
@@ -0,0 +1,47 @@
+"""Tests for the Memory Bank service facade."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from vertex_memory_bank.services import MemoryBankService
+
+
+class AgentEnginesStub:
+    def __init__(self) -> None:
+        self.created: list[str] = []
+        self.configs: list[Any] = []
+        self._lock = threading.Lock()
+
+    def create_memory(self, *, name: str, fact: str, scope: dict[str, str], config: Any) -> SimpleNamespace:
+        time.sleep(0.01)
+        with self._lock:
+            self.created.append(fact)
+            self.configs.append(config)
+            memory_id = len(self.created)
+        return SimpleNamespace(response=SimpleNamespace(name=f"{name}/memories/{memory_id}", fact=fact, scope=scope))
+
+
+class ClientManagerStub:
+    def __init__(self) -> None:
+        self.agent_engines = AgentEnginesStub()
+
+    def require_ready(self) -> tuple[SimpleNamespace, str]:
+        return SimpleNamespace(agent_engines=self.agent_engines), "projects/p/locations/l/reasoningEngines/1"
+
+
+def test_identical_concurrent_creates_each_create_a_memory() -> None:
+    manager = ClientManagerStub()
+    service = MemoryBankService(manager)  # type: ignore[arg-type]
+
+    async def scenario() -> list[dict[str, Any]]:
+        return await asyncio.gather(
+            *(service.create_memory(fact=" likes tea ", scope={"user_id": "abc"}, ttl_seconds=None) for _ in range(3))
+        )
+
+    results = asyncio.run(scenario())
+    assert manager.agent_engines.created == ["likes tea"] * 3
+    assert manager.agent_engines.configs == [None] * 3
+    assert len({result["memory"]["name"] for result in results}) == 3
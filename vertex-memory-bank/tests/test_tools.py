@@ -0,0 +1,149 @@
+"""Tests for MCP tool helpers."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from vertex_memory_bank import tools
+from vertex_memory_bank.app_state import app_state
+from vertex_memory_bank.errors import VertexServiceError
+
+
+SCOPE = {"user_id": "abc"}
+
+
+class ServiceStub:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.active = 0
+        self.peak = 0
+
+    async def _record(self, method: str, delay: float, **kwargs: Any) -> None:
+        self.calls.append((method, kwargs))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+
+    async def create_memory(self, *, fact: str, scope: dict[str, str], ttl_seconds: int | None) -> dict[str, Any]:
+        # Later entries finish first, so ordering must come from the input rather than completion
+        await self._record("create_memory", 0.05 / len(fact), fact=fact, scope=scope, ttl_seconds=ttl_seconds)
+        return {"memory": {"fact": fact}}
+
+    async def delete_memory(self, *, memory_name: str) -> dict[str, Any]:
+        await self._record("delete_memory", 0, memory_name=memory_name)
+        if memory_name.endswith("missing"):
+            raise VertexServiceError("memory not found")
+        return {"deleted": memory_name}
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> ServiceStub:
+    stub = ServiceStub()
+    monkeypatch.setattr(app_state, "memory_service", stub)
+    return stub
+
+
+def run_batch(operations: list[Any], *, max_concurrent: int = 8, stop_on_error: bool = False) -> dict[str, Any]:
+    return asyncio.run(tools._batch_execute(operations, max_concurrent=max_concurrent, stop_on_error=stop_on_error))
+
+
+def create(fact: str) -> dict[str, Any]:
+    return {"operation": "create_memory", "arguments": {"fact": fact, "scope": SCOPE}}
+
+
+def test_batch_execute_returns_results_in_input_order(service: ServiceStub) -> None:
+    facts = ["a", "bb", "ccc", "dddd"]
+    response = run_batch([create(fact) for fact in facts])
+    assert response["status"] == "success"
+    assert [result["memory"]["fact"] for result in response["results"]] == facts
+    assert response["errors_count"] == 0
+    assert service.calls[0] == ("create_memory", {"fact": "a", "scope": SCOPE, "ttl_seconds": None})
+
+
+def test_batch_execute_bounds_concurrency(service: ServiceStub) -> None:
+    response = run_batch([create("x" * n) for n in range(1, 7)], max_concurrent=2)
+    assert response["errors_count"] == 0
+    assert service.peak == 2
+
+
+def test_batch_execute_accepts_an_empty_batch(service: ServiceStub) -> None:
+    assert run_batch([]) == {"status": "success", "results": [], "errors_count": 0}
+    assert service.calls == []
+
+
+@pytest.mark.parametrize("max_concurrent", [0, -1])
+def test_batch_execute_rejects_non_positive_concurrency(service: ServiceStub, max_concurrent: int) -> None:
+    response = run_batch([create("fact")], max_concurrent=max_concurrent)
+    assert response == {"status": "error", "error": "max_concurrent must be positive"}
+    assert service.calls == []
+
+
+def test_batch_execute_rejects_unknown_operations(service: ServiceStub) -> None:
+    response = run_batch([create("fact"), {"operation": "initialize_memory_bank", "arguments": {}}])
+    assert response == {"status": "error", "error": "Operation 1 has unsupported operation 'initialize_memory_bank'"}
+    assert service.calls == []
+
+
+@pytest.mark.parametrize(
+    ("operation", "error"),
+    [
+        ("create_memory", "Operation 0 must be a dictionary"),
+        ({"operation": "create_memory", "arguments": ["fact"]}, "Operation 0 arguments must be a dictionary"),
+        ({"operation": "create_memory", "arguments": {"fact": "x"}}, "Operation 0 is missing scope"),
+        (
+            {"operation": "delete_memory", "arguments": {"memory_name": "m", "force": True}},
+            "Operation 0 has unknown arguments force",
+        ),
+        (
+            {"operation": "create_memory", "arguments": {"fact": "  ", "scope": SCOPE}},
+            "Operation 0: Fact cannot be empty",
+        ),
+        (
+            {"operation": "create_memory", "arguments": {"fact": "x", "scope": {}}},
+            "Operation 0: Scope cannot be empty",
+        ),
+        (
+            {"operation": "retrieve_memories", "arguments": {"scope": SCOPE, "top_k": 0}},
+            "Operation 0: top_k must be positive",
+        ),
+        (
+            {"operation": "retrieve_memories", "arguments": {"scope": SCOPE, "top_k": "5"}},
+            "Operation 0: top_k must be an integer",
+        ),
+        (
+            {"operation": "generate_memories", "arguments": {"scope": SCOPE, "conversation": [{"role": "bot"}]}},
+            "Operation 0: Turn 0 has invalid role",
+        ),
+    ],
+)
+def test_batch_execute_validates_every_entry_before_dispatch(service: ServiceStub, operation: Any, error: str) -> None:
+    assert run_batch([operation, create("valid")]) == {"status": "error", "error": error}
+    assert service.calls == []
+
+
+@pytest.mark.usefixtures("service")
+def test_batch_execute_counts_failed_operations() -> None:
+    operations = [
+        {"operation": "delete_memory", "arguments": {"memory_name": name}}
+        for name in ("memories/1", "memories/missing", "memories/2", "memories/missing")
+    ]
+    response = run_batch(operations)
+    assert response["status"] == "success"
+    assert response["errors_count"] == 2
+    assert [result["status"] for result in response["results"]] == ["success", "error", "success", "error"]
+    assert response["results"][1]["error"] == "memory not found"
+
+
+def test_batch_execute_stop_on_error_skips_remaining_operations(service: ServiceStub) -> None:
+    operations = [
+        {"operation": "delete_memory", "arguments": {"memory_name": name}}
+        for name in ("memories/missing", "memories/1", "memories/2")
+    ]
+    response = run_batch(operations, max_concurrent=1, stop_on_error=True)
+    assert response["errors_count"] == 3
+    assert [call[1]["memory_name"] for call in service.calls] == ["memories/missing"]
+    assert response["results"][1]["error"] == "Skipped after an earlier operation failed"
@@ -23,10 +23,10 @@ def test_validate_conversation_enforces_roles() -> None:
 
 
 def test_validate_memory_fact_bounds() -> None:
-    assert validators.validate_memory_fact("ok") is None
-    assert validators.validate_memory_fact("") == "Fact cannot be empty"
+    assert validators.validate_memory_fact(" ok ") == (None, "ok")
+    assert validators.validate_memory_fact("")[0] == "Fact cannot be empty"
     long_fact = "x" * 10_001
-    assert validators.validate_memory_fact(long_fact) == "Fact exceeds 10k character limit"
+    assert validators.validate_memory_fact(long_fact)[0] == "Fact exceeds 10k character limit"
 
 
 def test_validate_memory_topics_checks_iterables() -> None: